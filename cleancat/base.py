@@ -1,12 +1,9 @@
 import datetime
-import inspect
+import functools
 import re
 from operator import attrgetter
 from uuid import UUID as PythonUUID
 
-import pytz
-from dateutil import parser
-
 # Sentinel value which means "pick the default value" when encountered.
 default_sentinel = object()
 
@@ -19,6 +16,17 @@ class StopValidation(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _type_error_msg(base_type):
+    """Return the error message for a value that isn't of `base_type`."""
+    if isinstance(base_type, tuple):
+        allowed_types = [typ.__name__ for typ in base_type]
+        allowed_types_text = " or ".join(allowed_types)
+    else:
+        allowed_types_text = base_type.__name__
+    return "Value must be of %s type." % allowed_types_text
+
+
 class Field:
     # If specified, the field ensures that the supplied value is an instance
     # of this type. Can be either a single specific type (e.g. int) or a tuple
@@ -60,18 +68,15 @@ class Field:
 
     def clean(self, value):
         """Take a dirty value and clean it."""
+        base_type = self.base_type
         if (
-            self.base_type is not None
+            base_type is not None
             and value is not None
-            and not isinstance(value, self.base_type)
+            # Exact type match is the common case and cheaper than isinstance.
+            and type(value) is not base_type
+            and not isinstance(value, base_type)
         ):
-            if isinstance(self.base_type, tuple):
-                allowed_types = [typ.__name__ for typ in self.base_type]
-                allowed_types_text = " or ".join(allowed_types)
-            else:
-                allowed_types_text = self.base_type.__name__
-            err_msg = "Value must be of %s type." % allowed_types_text
-            raise ValidationError(err_msg)
+            raise ValidationError(_type_error_msg(base_type))
 
         if not self.has_value(value):
             if self.default is not None:
@@ -94,6 +99,15 @@ class Field:
         return value
 
 
+def _next_clean_is_field_clean(field, cls):
+    """
+    Return whether the clean() that `cls.clean` would delegate to via super()
+    for the given field instance is Field.clean itself.
+    """
+    next_clean = getattr(super(cls, field), "clean", None)
+    return getattr(next_clean, "__func__", None) is Field.clean
+
+
 class String(Field):
     base_type = str
     blank_value = ""
@@ -107,6 +121,16 @@ class String(Field):
             self.max_length = max_length
         super().__init__(**kwargs)
 
+        # A non-empty str always passes the type and presence checks, unless
+        # a subclass changes what they are or adds its own clean() after
+        # String in the MRO (e.g. via a mixin).
+        cls = type(self)
+        self._skip_str_checks = (
+            cls.base_type is str
+            and cls.has_value is String.has_value
+            and _next_clean_is_field_clean(self, String)
+        )
+
     def _check_length(self, value):
         if self.max_length is not None and len(value) > self.max_length:
             err_msg = "The value must be no longer than %s characters." % (
@@ -121,7 +145,8 @@ class String(Field):
             raise ValidationError(err_msg)
 
     def clean(self, value):
-        value = super().clean(value)
+        if type(value) is not str or not value or not self._skip_str_checks:
+            value = super().clean(value)
         self._check_length(value)
         return value
 
@@ -157,6 +182,9 @@ class Regex(String):
     regex_flags = 0
     regex_message = "Invalid input."
 
+    # Bound `match` method of the compiled regex, set by get_regex.
+    _regex_match = None
+
     def __init__(
         self, regex=None, regex_flags=None, regex_message=None, **kwargs
     ):
@@ -171,17 +199,25 @@ class Regex(String):
     def get_regex(self):
         if not getattr(self, "_compiled_regex", None):
             self._compiled_regex = re.compile(self.regex, self.regex_flags)
+            self._regex_match = self._compiled_regex.match
         return self._compiled_regex
 
     def clean(self, value):
         value = super().clean(value)
 
-        if not self.get_regex().match(value):
+        if not (self._regex_match or self.get_regex().match)(value):
             raise ValidationError(self.regex_message)
 
         return value
 
 
+# Translation table which deletes all the ASCII characters that can appear
+# in an ISO 8601 string matched by DateTime.regex.
+_ISO_8601_CHARS_TABLE = str.maketrans(
+    "", "", "0123456789+-:.,TWZz \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+)
+
+
 class DateTime(Regex):
     """ISO 8601 from http://www.pelagodesign.com/blog/2009/05/20/iso-8601-date-validation-that-doesnt-suck/"""
 
@@ -204,16 +240,25 @@ class DateTime(Regex):
         # XXX we're skipping a level of inheritance so that we can reuse
         # the regex match later in this method.
         value = super(Regex, self).clean(value)
-        match = self.get_regex().match(value)
+
+        # Cheaply reject values containing ASCII characters which can never
+        # appear in an ISO 8601 string before running the (expensive) regex.
+        # Non-ASCII leftovers may still be Unicode digits or whitespace, so
+        # those are left for the regex to decide.
+        leftover = value.translate(_ISO_8601_CHARS_TABLE)
+        if leftover and leftover.isascii():
+            raise ValidationError(self.regex_message)
+
+        match = (self._regex_match or self.get_regex().match)(value)
         if not match:
             raise ValidationError(self.regex_message)
         try:
-            dt = parser.parse(value)
+            dt = _parse_iso(value)
         except ValueError as e:
             raise ValidationError("Could not parse datetime") from e
         if self.min_date:
             if dt.tzinfo is not None and self.min_date.tzinfo is None:
-                min_date = self.min_date.replace(tzinfo=pytz.utc)
+                min_date = self.min_date.replace(tzinfo=datetime.timezone.utc)
             else:
                 min_date = self.min_date
             if dt < min_date:
@@ -235,6 +280,88 @@ class DateTime(Regex):
             return value.isoformat()
 
 
+_iso_8601_match = re.compile(DateTime.regex).match
+
+
+def _parse_iso(value):
+    """Parse an ISO 8601 string into a datetime.
+
+    The common calendar-date forms (e.g. "2012-10-09T13:10:04.137Z") are
+    built straight from the regex groups. Anything more exotic (week and
+    ordinal dates, signed years, partial dates, fractional minutes, etc.)
+    falls back to dateutil, which is considerably slower (both to import and
+    to run).
+
+    Raises ValueError if the value can't be parsed.
+    """
+    dt = _parse_iso_calendar_date(value)
+    if dt is None:
+        # dateutil.parser is slow to import, so only pay for it when needed.
+        # Its results aren't cached since it fills in missing fields (e.g. the
+        # day of "2013-03") from the current date.
+        from dateutil import parser
+
+        dt = parser.parse(value)
+    return dt
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_calendar_date(value):
+    """Build a datetime from a complete ISO 8601 calendar date string.
+
+    Returns None if the value isn't in one of the forms handled here, in
+    which case it should be parsed with dateutil instead.
+    """
+    match = _iso_8601_match(value)
+    if (
+        match is None
+        or len(match.group(1)) != 4
+        or match.group(7) is None
+        or (
+            match.group(12) is not None
+            and (
+                match.group(16) is None
+                or match.group(18) is not None
+                or (match.group(20) or ".")[0] != "."
+            )
+        )
+    ):
+        return None
+
+    year, month, day = (int(match.group(n)) for n in (1, 5, 7))
+    if match.group(12) is None:
+        return datetime.datetime(year, month, day)
+
+    second = match.group(19)
+    fraction = match.group(20)
+    microsecond = int(fraction[1:7].ljust(6, "0")) if fraction else 0
+
+    tzinfo = None
+    if match.group(21) is not None:
+        from dateutil import tz
+
+        tzinfo = tz.UTC
+        if match.group(22) is not None:  # numeric offset rather than "Z"
+            offset = (
+                int(match.group(23)) * 3600 + int(match.group(24) or 0) * 60
+            )
+            if match.group(22) == "-":
+                offset = -offset
+            if offset:
+                tzinfo = tz.tzoffset(None, offset)
+
+    return datetime.datetime(
+        year,
+        month,
+        day,
+        int(match.group(15)),
+        int(match.group(16)[-2:]),
+        int(second.lstrip(":")[:2]) if second else 0,
+        microsecond,
+        tzinfo=tzinfo,
+    )
+
+
 class Email(Regex):
     regex = (
         r"^(?:[^\.@\s]|[^\.@\s]\.(?!\.))*[^.@\s]@"
@@ -248,9 +375,103 @@ class Email(Regex):
         # trim any leading/trailing whitespace before validating the email
         if isinstance(value, str):
             value = value.strip()
+
+            # ASCII addresses can be validated with a few str methods, which
+            # is a lot cheaper than running them through the regex engine.
+            if (
+                value.isascii()
+                and self.regex == Email.regex
+                and self.regex_flags == Email.regex_flags
+            ):
+                # XXX we skip a level of inheritance so that we don't run the
+                # regex.
+                value = super(Regex, self).clean(value)
+                if not _is_valid_ascii_email(value):
+                    raise ValidationError(self.regex_message)
+                return value
+
         return super().clean(value)
 
 
+def _is_valid_ascii_email(value):
+    """Check an ASCII string against the same rules as the Email regex."""
+    # No whitespace anywhere.
+    if value.split(None, 1) != [value]:
+        return False
+
+    local, _, domain = value.partition("@")
+    if not local or not domain or "@" in domain:
+        return False
+
+    # Neither part may start with a dot or contain consecutive dots, and the
+    # local part can't end with one either.
+    if (
+        local[0] == "."
+        or local[-1] == "."
+        or domain[0] == "."
+        or ".." in local
+        or ".." in domain
+    ):
+        return False
+
+    # The domain must end with a 2-63 letter TLD.
+    _, dot, tld = domain.rpartition(".")
+    return bool(dot) and 2 <= len(tld) <= 63 and tld.isalpha()
+
+
+_URL_SCHEME_REGEX = re.compile("^[a-z]+://", re.IGNORECASE)
+
+
+def _normalize_url_scheme(scheme):
+    if scheme.endswith(("://", ":")):
+        return scheme
+    return scheme + "://"
+
+
+# URL fields are typically declared many times over with just a handful of
+# distinct options, so the regexes below are built once per combination.
+
+
+@functools.lru_cache(maxsize=None)
+def _url_regex(require_tld, optional_scheme):
+    """Return the URL regex for the given options."""
+    # FQDN validation similar to https://github.com/chriso/validator.js/blob/master/src/lib/isFQDN.js
+
+    # ff01-ff5f -> full-width chars, not allowed
+    alpha_numeric_and_symbols_ranges = "0-9a-z\u00a1-\uff00\uff5f-\uffff"
+
+    tld_part = (
+        require_tld
+        and r"\.[%s-]{2,63}" % alpha_numeric_and_symbols_ranges
+        or ""
+    )
+    scheme_part = "(?P<scheme>[a-z]+://)"
+    if optional_scheme:
+        scheme_part = "%s?" % scheme_part
+    return rf"^{scheme_part}([-{alpha_numeric_and_symbols_ranges}@:%_+.~#?&/\\=]{{1,256}}{tld_part}|([0-9]{{1,3}}\.){{3}}[0-9]{{1,3}})(:[0-9]+)?([/?].*)?$"
+
+
+@functools.lru_cache(maxsize=None)
+def _url_scheme_regexes(schemes):
+    """Return a tuple of regexes, each matching URLs that use one scheme."""
+    return tuple(
+        re.compile("^" + _normalize_url_scheme(sch) + ".*", re.IGNORECASE)
+        for sch in schemes
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _url_schemes_regex(schemes):
+    """Return a regex matching URLs that use any of the given schemes."""
+    # A single alternation is cheaper than matching each scheme's regex
+    # separately.
+    return re.compile(
+        "^(?:%s)"
+        % "|".join("(?:%s)" % _normalize_url_scheme(sch) for sch in schemes),
+        re.IGNORECASE,
+    )
+
+
 class URL(Regex):
     blank_value = None
 
@@ -262,60 +483,49 @@ class URL(Regex):
         disallowed_schemes=None,
         **kwargs,
     ):
-        def normalize_scheme(sch):
-            if sch.endswith(("://", ":")):
-                return sch
-            return sch + "://"
-
-        # FQDN validation similar to https://github.com/chriso/validator.js/blob/master/src/lib/isFQDN.js
-
-        # ff01-ff5f -> full-width chars, not allowed
-        alpha_numeric_and_symbols_ranges = "0-9a-z\u00a1-\uff00\uff5f-\uffff"
-
-        tld_part = (
-            require_tld
-            and r"\.[%s-]{2,63}" % alpha_numeric_and_symbols_ranges
-            or ""
-        )
-        scheme_part = "[a-z]+://"
         self.default_scheme = default_scheme
         if self.default_scheme:
-            self.default_scheme = normalize_scheme(self.default_scheme)
-        self.scheme_regex = re.compile("^" + scheme_part, re.IGNORECASE)
-        if default_scheme:
-            scheme_part = "(%s)?" % scheme_part
-        regex = rf"^{scheme_part}([-{alpha_numeric_and_symbols_ranges}@:%_+.~#?&/\\=]{{1,256}}{tld_part}|([0-9]{{1,3}}\.){{3}}[0-9]{{1,3}})(:[0-9]+)?([/?].*)?$"
+            self.default_scheme = _normalize_url_scheme(self.default_scheme)
+        self.scheme_regex = _URL_SCHEME_REGEX
+        self._scheme_match = self.scheme_regex.match
         super().__init__(
-            regex=regex,
+            regex=_url_regex(bool(require_tld), bool(default_scheme)),
             regex_flags=re.IGNORECASE | re.UNICODE,
             regex_message="Invalid URL.",
             **kwargs,
         )
 
-        def compile_schemes_to_regexes(schemes):
-            return [
-                re.compile("^" + normalize_scheme(sch) + ".*", re.IGNORECASE)
-                for sch in schemes
-            ]
-
         self.allowed_schemes = allowed_schemes or []
-        self.allowed_schemes_regexes = compile_schemes_to_regexes(
-            self.allowed_schemes
+        self.allowed_schemes_regexes = list(
+            _url_scheme_regexes(tuple(self.allowed_schemes))
+        )
+        self.allowed_schemes_regex = _url_schemes_regex(
+            tuple(self.allowed_schemes)
         )
 
         self.disallowed_schemes = disallowed_schemes or []
-        self.disallowed_schemes_regexes = compile_schemes_to_regexes(
-            self.disallowed_schemes
+        self.disallowed_schemes_regexes = list(
+            _url_scheme_regexes(tuple(self.disallowed_schemes))
+        )
+        self.disallowed_schemes_regex = _url_schemes_regex(
+            tuple(self.disallowed_schemes)
         )
 
     def clean(self, value):
-        value = super().clean(value)
-        if not self.scheme_regex.match(value):
+        # XXX we're skipping a level of inheritance so that we can reuse
+        # the regex match later in this method.
+        value = super(Regex, self).clean(value)
+        match = (self._regex_match or self.get_regex().match)(value)
+        if not match:
+            raise ValidationError(self.regex_message)
+
+        # The URL regex captures the scheme, so only fall back to the scheme
+        # regex if the (optional) scheme group didn't match.
+        if not match.group("scheme") and not self._scheme_match(value):
             value = self.default_scheme + value
 
-        if self.allowed_schemes and not any(
-            allowed_regex.match(value)
-            for allowed_regex in self.allowed_schemes_regexes
+        if self.allowed_schemes and not self.allowed_schemes_regex.match(
+            value
         ):
             allowed_schemes_text = " or ".join(self.allowed_schemes)
             err_msg = (
@@ -324,9 +534,8 @@ class URL(Regex):
             )
             raise ValidationError(err_msg)
 
-        if self.disallowed_schemes and any(
-            disallowed_regex.match(value)
-            for disallowed_regex in self.disallowed_schemes_regexes
+        if self.disallowed_schemes and self.disallowed_schemes_regex.match(
+            value
         ):
             err_msg = "This URL uses a scheme that's not allowed."
             raise ValidationError(err_msg)
@@ -354,6 +563,16 @@ class Integer(Field):
         self.min_value = min_value
         super().__init__(**kwargs)
 
+        # A plain int always passes the type and presence checks, unless a
+        # subclass changes what they are or adds its own clean() after
+        # Integer in the MRO (e.g. via a mixin).
+        cls = type(self)
+        self._skip_int_checks = (
+            cls.base_type is int
+            and cls.has_value is Field.has_value
+            and _next_clean_is_field_clean(self, Integer)
+        )
+
     def _check_value(self, value):
         if self.max_value is not None and value > self.max_value:
             err_msg = "The value must not be larger than %d." % self.max_value
@@ -364,7 +583,8 @@ class Integer(Field):
             raise ValidationError(err_msg)
 
     def clean(self, value):
-        value = super().clean(value)
+        if type(value) is not int or not self._skip_int_checks:
+            value = super().clean(value)
         self._check_value(value)
         return value
 
@@ -378,6 +598,12 @@ class List(Field):
         super().__init__(**kwargs)
         self.field_instance = field_instance
 
+        # Plain Integer and String fields can validate the whole list at once,
+        # and references may be fetched in bulk.
+        self._batch_clean = _BATCH_CLEANERS.get(type(field_instance))
+        if self._batch_clean is None and isinstance(field_instance, Reference):
+            self._batch_clean = _batch_clean_references
+
     def has_value(self, value):
         return bool(value)
 
@@ -391,17 +617,25 @@ class List(Field):
         if self.max_length and item_cnt > self.max_length:
             raise ValidationError("List is too long.")
 
+        if self._batch_clean is not None:
+            data = self._batch_clean(self.field_instance, value)
+            if data is not None:
+                return data
+
+        # Bind the per-item callables once rather than on every iteration.
+        clean_item = self.field_instance.clean
         errors = {}
         data = []
+        append = data.append
         for n, item in enumerate(value):
             try:
-                cleaned_data = self.field_instance.clean(item)
+                cleaned_data = clean_item(item)
             except ValidationError as e:
                 errors[n] = e.args and e.args[0]
             except StopValidation as e:
-                data.append(e.args and e.args[0])
+                append(e.args and e.args[0])
             else:
-                data.append(cleaned_data)
+                append(cleaned_data)
 
         if errors:
             raise ValidationError({"errors": errors})
@@ -412,7 +646,87 @@ class List(Field):
         # Serialize all falsy values as an empty list.
         if not value:
             return []
-        return [self.field_instance.serialize(item) for item in value]
+        return list(map(self.field_instance.serialize, value))
+
+
+def _batch_clean_integers(field, values):
+    """
+    Clean a list of values with a plain Integer field in one go.
+
+    Returns None if any of the values isn't valid, in which case they should
+    be cleaned one by one to collect the errors.
+    """
+    if not set(map(type, values)) <= {int, bool}:
+        return None
+    if field.min_value is not None and min(values) < field.min_value:
+        return None
+    if field.max_value is not None and max(values) > field.max_value:
+        return None
+    return list(values)
+
+
+def _batch_clean_strings(field, values):
+    """
+    Clean a list of values with a plain String field in one go.
+
+    Returns None if any of the values isn't valid, in which case they should
+    be cleaned one by one to collect the errors.
+    """
+    if set(map(type, values)) != {str} or not all(values):
+        return None
+    if field.min_length is not None or field.max_length is not None:
+        lengths = list(map(len, values))
+        if field.min_length is not None and min(lengths) < field.min_length:
+            return None
+        if field.max_length is not None and max(lengths) > field.max_length:
+            return None
+    return list(values)
+
+
+def _defining_class(cls, name):
+    """Return the class in `cls`'s MRO which defines the attribute `name`."""
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+def _batch_clean_references(field, values):
+    """
+    Clean a list of IDs with a Reference field using a single bulk fetch.
+
+    Returns None if the field can't fetch its objects in bulk or if any of the
+    IDs isn't valid, in which case they should be cleaned one by one to
+    collect the errors.
+    """
+    field_cls = type(field)
+    if (
+        field_cls.clean is not Reference.clean
+        or field_cls.has_value is not Field.has_value
+        or field.base_type is not str
+        or not _next_clean_is_field_clean(field, Reference)
+        # fetch_object is the documented extension point, so a subclass which
+        # overrides it (e.g. to filter out some objects) but not fetch_objects
+        # has to be cleaned item by item.
+        or "fetch_object" in vars(field)
+        or _defining_class(field_cls, "fetch_object")
+        is not _defining_class(field_cls, "fetch_objects")
+        or set(map(type, values)) != {str}
+    ):
+        return None
+    objs = field.fetch_objects(values)
+    if objs is None:
+        return None
+    try:
+        return [objs[value] for value in values]
+    except KeyError:
+        return None
+
+
+_BATCH_CLEANERS = {
+    Integer: _batch_clean_integers,
+    String: _batch_clean_strings,
+}
 
 
 class Dict(Field):
@@ -433,12 +747,7 @@ class Embedded(Dict):
 
     def clean(self, value):
         value = super().clean(value)
-        try:
-            cleaned_value = self.schema_class(value).full_clean()
-        except ValidationError as e:
-            raise e
-        else:
-            return cleaned_value
+        return self.schema_class(value).full_clean()
 
     def is_valid(self):
         try:
@@ -585,6 +894,20 @@ class Reference(Field):
         """
         raise NotImplementedError  # should be subclassed
 
+    def fetch_objects(self, ref_ids):
+        """Fetch the existing objects for multiple IDs at once.
+
+        Optional. Subclasses can implement this so that a List of references
+        is looked up with a single query instead of one query per item. It's
+        only used if it's defined by the same class as fetch_object, so that
+        subclasses which customize fetch_object keep getting called per item.
+
+        :param list ref_ids: string IDs of the referenced objects.
+        :returns: dict mapping the string IDs of the objects that were found
+            to the objects, or None if the objects can't be fetched in bulk.
+        """
+        return None
+
 
 class Choices(Field):
     """
@@ -605,9 +928,38 @@ class Choices(Field):
             error_invalid_choice or "Not a valid choice."
         )
 
+        # Tuple of (choices, lookup table), see _get_choice_lookup.
+        self._choice_lookup = None
+
     def get_choices(self):
         return self.choices
 
+    def _get_choice_lookup(self):
+        """
+        Return a lookup table for the choices returned by `get_choices`.
+
+        For case insensitive fields, this is a dict mapping lowercased choices
+        to the original ones. Otherwise, it's a frozenset of the choices (or
+        the choices themselves if they aren't hashable).
+
+        The table is only rebuilt when `get_choices` returns a different
+        object than the last time around.
+        """
+        choices = self.get_choices()
+        if (
+            self._choice_lookup is None
+            or self._choice_lookup[0] is not choices
+        ):
+            if self.case_insensitive:
+                lookup = {choice.lower(): choice for choice in choices}
+            else:
+                try:
+                    lookup = frozenset(choices)
+                except TypeError:
+                    lookup = choices
+            self._choice_lookup = (choices, lookup)
+        return self._choice_lookup[1]
+
     def format_invalid_choice_msg(self, value):
         return self.error_invalid_choice.format(
             value=value, valid_choices=", ".join(self.get_choices())
@@ -616,21 +968,25 @@ class Choices(Field):
     def clean(self, value):
         value = super().clean(value)
 
-        choices = self.get_choices()
+        lookup = self._get_choice_lookup()
 
         if self.case_insensitive:
-            choices = {choice.lower(): choice for choice in choices}
-
             if not isinstance(value, str):
                 raise ValidationError("Value needs to be a string.")
 
-            if value.lower() not in choices:
+            choice = lookup.get(value.lower())
+            if choice is None:
                 err_msg = self.format_invalid_choice_msg(value)
                 raise ValidationError(err_msg)
 
-            return choices[value.lower()]
+            return choice
+
+        try:
+            is_valid = value in lookup
+        except TypeError:  # unhashable value, so it can't be in a frozenset
+            is_valid = False
 
-        if value not in choices:
+        if not is_valid:
             err_msg = self.format_invalid_choice_msg(value)
             raise ValidationError(err_msg)
 
@@ -651,16 +1007,17 @@ class Enum(Choices):
           more than one choice in this list and *all* of the choices must
           belong to the same enum class.
         """
-        is_cls = inspect.isclass(choices)
+        is_cls = isinstance(choices, type)
         if is_cls:
             self.enum_cls = choices
         else:
             assert choices, "You need to provide at least one enum choice."
             self.enum_cls = choices[0].__class__
         super().__init__(choices, **kwargs)
+        self._choice_values = [choice.value for choice in self.choices]
 
     def get_choices(self):
-        return [choice.value for choice in self.choices]
+        return self._choice_values
 
     def clean(self, value):
         value = super().clean(value)
@@ -684,6 +1041,12 @@ class SortedSet(List):
         return sorted(set(super().clean(value)), key=self.key)
 
 
+# Schema instance attributes which can't be used as field names.
+_RESERVED_FIELD_NAMES = frozenset(
+    {"raw_data", "orig_data", "data", "errors", "field_errors", "fields"}
+)
+
+
 class Schema:
     """
     Base Schema class. Provides core behavior like fields declaration
@@ -743,13 +1106,18 @@ class Schema:
         """
         Returns a dictionary of fields and field instances for this schema.
         """
-        fields = {}
-        for field_name in dir(cls):
-            if isinstance(getattr(cls, field_name), Field):
-                field = getattr(cls, field_name)
-                field_name = field.field_name or field_name
-                fields[field_name] = field
-        return fields
+        # Scanning dir(cls) is expensive, so it's done once per class. A copy
+        # is returned since schema instances are free to modify their fields.
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = {}
+            for field_name in dir(cls):
+                if isinstance(getattr(cls, field_name), Field):
+                    field = getattr(cls, field_name)
+                    field_name = field.field_name or field_name
+                    fields[field_name] = field
+            cls._cached_fields = fields
+        return dict(fields)
 
     @classmethod
     def obj_to_dict(cls, obj):
@@ -776,20 +1144,18 @@ class Schema:
         return data
 
     def __init__(self, raw_data=None, data=None):
-        conflicting_fields = {
-            "raw_data",
-            "orig_data",
-            "data",
-            "errors",
-            "field_errors",
-            "fields",
-        }.intersection(dir(self))
-        if conflicting_fields:
-            raise Exception(
-                "The following field names are reserved and need to be renamed: %s. "
-                "Please use the field_name keyword to use them."
-                % list(conflicting_fields)
-            )
+        # Like get_fields, the (dir-based) check only needs to run once per
+        # schema class.
+        cls = type(self)
+        if "_field_names_checked" not in cls.__dict__:
+            conflicting_fields = _RESERVED_FIELD_NAMES.intersection(dir(cls))
+            if conflicting_fields:
+                raise Exception(
+                    "The following field names are reserved and need to be renamed: %s. "
+                    "Please use the field_name keyword to use them."
+                    % list(conflicting_fields)
+                )
+            cls._field_names_checked = True
 
         self.raw_data = raw_data or {}
         self.orig_data = data or None
@@ -815,6 +1181,12 @@ class Schema:
                 {"errors": ["Invalid request: JSON dictionary expected."]}
             )
 
+        # Look up the instance attributes once rather than for every field.
+        raw_data = self.raw_data
+        data = self.data
+        orig_data = self.orig_data
+        field_errors = self.field_errors
+
         for field_name, field in self.fields.items():
             if field.read_only:
                 continue
@@ -822,16 +1194,16 @@ class Schema:
             try:
                 # Validate a field if it's posted in raw_data, or if we don't
                 # have a value for it in case it's required.
-                if raw_field_name in self.raw_data or not field.has_value(
-                    self.data.get(field_name, None)
+                if raw_field_name in raw_data or not field.has_value(
+                    data.get(field_name, None)
                 ):
-                    value = field.clean(self.raw_data.get(raw_field_name))
+                    value = field.clean(raw_data.get(raw_field_name))
                     if (
                         not field.mutable
-                        and self.orig_data
-                        and field_name in self.orig_data
+                        and orig_data
+                        and field_name in orig_data
                     ):
-                        old_value = self.orig_data[field_name]
+                        old_value = orig_data[field_name]
 
                         # compare datetimes properly, regardless of whether they're offset-naive or offset-aware
                         if isinstance(value, datetime.datetime) and isinstance(
@@ -849,12 +1221,12 @@ class Schema:
                         if value != old_value:
                             raise ValidationError("Value cannot be changed.")
 
-                    self.data[field_name] = value
+                    data[field_name] = value
 
             except ValidationError as e:
-                self.field_errors[raw_field_name] = e.args and e.args[0]
+                field_errors[raw_field_name] = e.args and e.args[0]
             except StopValidation as e:
-                self.data[field_name] = e.args and e.args[0]
+                data[field_name] = e.args and e.args[0]
 
         try:
             self.clean()
@@ -888,10 +1260,10 @@ class Schema:
 
     def serialize(self):
         data = {}
+        values = self.data
         for field_name, field in self.fields.items():
             raw_field_name = field.raw_field_name or field_name
-            value = self.data[field_name]
-            data[raw_field_name] = field.serialize(value)
+            data[raw_field_name] = field.serialize(values[field_name])
         return data
 
 
@@ -985,16 +1357,19 @@ class CleanDict(Dict):
         if self.max_length and len(value) > self.max_length:
             raise ValidationError("Dict is too long.")
 
+        # Bind the per-item callables once rather than on every iteration.
+        clean_key = self.key_schema.clean
+        clean_value = self.value_schema.clean
         errors = {}
         data = {}
         for key, item_value in value.items():
             try:
-                cleaned_key = self.key_schema.clean(key)
+                cleaned_key = clean_key(key)
             except ValidationError as e:
                 errors[key] = e.args and e.args[0]
             else:
                 try:
-                    data[cleaned_key] = self.value_schema.clean(item_value)
+                    data[cleaned_key] = clean_value(item_value)
                 except ValidationError as e:
                     errors[key] = e.args and e.args[0]
                 except StopValidation as e:
@@ -1009,9 +1384,11 @@ class CleanDict(Dict):
         # Serialize all falsy values as an empty dict.
         if not value:
             return {}
+        serialize_key = self.key_schema.serialize
+        serialize_value = self.value_schema.serialize
         return {
-            self.key_schema.serialize(key): self.value_schema.serialize(value)
-            for key, value in value.items()
+            serialize_key(key): serialize_value(item_value)
+            for key, item_value in value.items()
         }
 
 
@@ -4,6 +4,8 @@ a required dependency, hence to use these fields, you'll have to import
 them via `from cleancat.mongo import ...`.
 """
 
+import functools
+
 from mongoengine import ValidationError as MongoValidationError
 
 from .base import (
@@ -15,6 +17,23 @@ from .base import (
 )
 
 
+def _get_upstream_data(doc):
+    # Take a snapshot, since clean_existing sets attributes on the document
+    # while orig_data is still in use.
+    return dict(doc._data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_data_extractor(doc_cls):
+    """Return a function which gets a dict of a document's data."""
+    if getattr(doc_cls, "to_dict", None):
+        # MongoMallard
+        return doc_cls.to_dict
+    else:
+        # Upstream MongoEngine
+        return _get_upstream_data
+
+
 class MongoEmbedded(Embedded):
     """
     Represents MongoEngine's EmbeddedDocument. Expects the document's
@@ -45,22 +64,17 @@ class MongoEmbeddedReference(EmbeddedReference):
     """
 
     def fetch_existing(self, pk):
-        doc_cls = self.object_class
         try:
-            return doc_cls.objects.get(pk=pk)
-        except doc_cls.DoesNotExist as e:
-            raise ReferenceNotFoundError from e
+            doc = self.object_class.objects(pk=pk).first()
         except MongoValidationError as e:
             raise ValidationError(str(e)) from e
+        if doc is None:
+            raise ReferenceNotFoundError
+        return doc
 
     def get_orig_data_from_existing(self, obj):
         # Get a dict of existing document's field names and values.
-        if getattr(obj, "to_dict", None):
-            # MongoMallard
-            return obj.to_dict()
-        else:
-            # Upstream MongoEngine
-            return dict(obj._data)
+        return _get_data_extractor(type(obj))(obj)
 
 
 class MongoReference(Reference):
@@ -68,14 +82,41 @@ class MongoReference(Reference):
     Represents a reference to a MongoEngine document. Expects an ID string as
     input and returns a cleaned document instance (verifying that it exists
     first).
+
+    If only some of the document's fields are needed (e.g. just its PK),
+    `fetch_fields` can limit which of them are loaded from the database.
     """
 
+    # Names of the document fields to load, or None to load all of them.
+    fetch_fields = None
+
+    def __init__(self, object_class, fetch_fields=None, **kwargs):
+        if fetch_fields is not None:
+            self.fetch_fields = fetch_fields
+        super().__init__(object_class, **kwargs)
+
+    def get_queryset(self):
+        """Return the queryset the referenced documents are fetched from."""
+        qs = self.object_class.objects
+        if self.fetch_fields is not None:
+            qs = qs.only(*self.fetch_fields)
+        return qs
+
     def fetch_object(self, doc_id):
         """Fetch the document by its PK."""
+        doc = self.get_queryset()(pk=doc_id).first()
+        if doc is None:
+            raise ReferenceNotFoundError
+        return doc
+
+    def fetch_objects(self, doc_ids):
+        """Fetch the documents for multiple PKs with a single query."""
         try:
-            return self.object_class.objects.get(pk=doc_id)
-        except self.object_class.DoesNotExist as e:
-            raise ReferenceNotFoundError from e
+            docs = self.get_queryset()(pk__in=doc_ids)
+            return {str(doc.pk): doc for doc in docs}
+        except MongoValidationError:
+            # Let the invalid PKs fail individually.
+            return None
 
     def serialize(self, doc):
         if doc:
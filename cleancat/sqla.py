@@ -4,19 +4,26 @@ a required dependency, hence to use these fields, you'll have to import
 them via `from cleancat.sqla import ...`.
 """
 
+import functools
+from operator import attrgetter
+
 from sqlalchemy import inspect
 
 from .base import EmbeddedReference, Reference, ReferenceNotFoundError
 
 
+@functools.lru_cache(maxsize=None)
+def _column_keys(model_cls):
+    """Return the keys of the given model's column attributes."""
+    return tuple(c.key for c in inspect(model_cls).column_attrs)
+
+
 def object_as_dict(obj):
     """Turn an SQLAlchemy model into a dict of field names and values.
 
     Based on https://stackoverflow.com/a/37350445/1579058
     """
-    return {
-        c.key: getattr(obj, c.key) for c in inspect(obj).mapper.column_attrs
-    }
+    return {key: getattr(obj, key) for key in _column_keys(type(obj))}
 
 
 class SQLAEmbeddedReference(EmbeddedReference):
@@ -32,7 +39,7 @@ class SQLAEmbeddedReference(EmbeddedReference):
 
     def fetch_existing(self, pk):
         model_cls = self.object_class
-        model = model_cls.query.get(pk)
+        model = model_cls.query.session.get(model_cls, pk)
         if not model:
             raise ReferenceNotFoundError
         return model
@@ -48,19 +55,40 @@ class SQLAReference(Reference):
     first).
     """
 
+    # Model attribute for `pk_field`, set by get_pk_field_instance.
+    _pk_field_instance = None
+
     def __init__(self, object_class, pk_field="id", **kwargs):
         self.pk_field = pk_field
+        self._get_pk = attrgetter(pk_field)
         super().__init__(object_class, **kwargs)
 
+    def get_pk_field_instance(self):
+        if self._pk_field_instance is None:
+            self._pk_field_instance = getattr(self.object_class, self.pk_field)
+        return self._pk_field_instance
+
     def fetch_object(self, model_id):
         """Fetch the model by its ID."""
-        pk_field_instance = getattr(self.object_class, self.pk_field)
+        pk_field_instance = self.get_pk_field_instance()
         qs = self.object_class.query.filter(pk_field_instance == model_id)
         model = qs.one_or_none()
         if not model:
             raise ReferenceNotFoundError
         return model
 
+    def fetch_objects(self, model_ids):
+        """Fetch the models for multiple IDs with a single query."""
+        pk_field_instance = self.get_pk_field_instance()
+        qs = self.object_class.query.filter(pk_field_instance.in_(model_ids))
+        models = qs.all()
+        get_pk = self._get_pk
+        objs = {str(get_pk(model)): model for model in models}
+        if len(objs) != len(models):
+            # `pk_field` isn't unique, let fetch_object report it per item.
+            return None
+        return objs
+
     def serialize(self, obj):
         if obj:
-            return getattr(obj, self.pk_field)
+            return self._get_pk(obj)
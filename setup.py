@@ -2,9 +2,10 @@ import re
 
 from setuptools import setup
 
-install_requirements = ["python-dateutil", "pytz"]
+install_requirements = ["python-dateutil"]
 test_requirements = install_requirements + [
     "pytest",
+    "pytz",
     "coverage",
     "mongoengine",
     "sqlalchemy",
@@ -4,6 +4,7 @@ import re
 from uuid import UUID as PythonUUID
 
 import pytest
+from dateutil import parser
 from pytz import utc
 
 from cleancat import (
@@ -126,6 +127,17 @@ class TestStringField:
                 "The value must be no longer than 20 characters.",
             )
 
+    def test_it_runs_mixin_clean_methods(self):
+        class Strip(Field):
+            def clean(self, value):
+                return super().clean(value).strip()
+
+        class StrippedString(String, Strip):
+            pass
+
+        assert StrippedString().clean("  x  ") == "x"
+        assert List(StrippedString()).clean(["  x  "]) == ["x"]
+
 
 class TestTrimmedStringField:
     def test_it_accepts_valid_input(self):
@@ -197,6 +209,21 @@ class TestChoicesField:
         assert field.clean("HeLlO") == "Hello"
         assert field.clean("woRlD") == "WORLD"
 
+    def test_it_rejects_unhashable_values(self):
+        expected_err_msg = "Not a valid choice."
+        with pytest.raises(ValidationError, match=expected_err_msg):
+            Choices(choices=["Hello", "World"]).clean(["Hello"])
+
+    def test_it_picks_up_dynamic_choices(self):
+        class DynamicChoices(Choices):
+            def get_choices(self):
+                return list(self.choices)
+
+        field = DynamicChoices(choices=["Hello"])
+        assert field.clean("Hello") == "Hello"
+        field.choices.append("World")
+        assert field.clean("World") == "World"
+
 
 class TestBoolField:
     @pytest.mark.parametrize("value", [True, False])
@@ -281,6 +308,35 @@ class TestDateTimeField:
         expected = datetime.datetime(2013, 3, 27, 1, 2, 1, 137000, tzinfo=utc)
         assert DateTime().clean(raw) == expected
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2013-03-27T01:02:01Z",
+            "20130327T010201.1370001-08:30",
+            "2013-03-27 01:02",
+            "2013-03-27T01:02:01+05",
+            "2013-03-27T01:02,5",
+        ],
+    )
+    def test_it_matches_dateutil(self, value):
+        assert DateTime().clean(value) == parser.parse(value)
+
+    def test_it_does_not_cache_partial_dates(self, monkeypatch):
+        # dateutil fills in the missing fields from the current date, so the
+        # result depends on when the value is parsed.
+        monkeypatch.setattr(
+            parser, "parse", lambda value: datetime.datetime(2013, 3, 16)
+        )
+        assert DateTime().clean("2013-03") == datetime.date(2013, 3, 16)
+        monkeypatch.setattr(
+            parser, "parse", lambda value: datetime.datetime(2013, 3, 17)
+        )
+        assert DateTime().clean("2013-03") == datetime.date(2013, 3, 17)
+
+    def test_it_rejects_invalid_day_of_month(self):
+        with pytest.raises(ValidationError, match="Could not parse datetime"):
+            DateTime().clean("2013-02-30T01:02:01Z")
+
     def test_it_rejects_invalid_year_range(self):
         with pytest.raises(ValidationError, match="Could not parse datetime"):
             DateTime().clean("0000-01-01T00:00:00-08:00")
@@ -311,7 +367,14 @@ class TestDateTimeField:
 
 class TestEmailField:
     @pytest.mark.parametrize(
-        "value", ["t@e.com", "test@example.com", "test.test@example.com"]
+        "value",
+        [
+            "t@e.com",
+            "test@example.com",
+            "test.test@example.com",
+            "TEST@EXAMPLE.COM",
+            "tést@exämple.com",
+        ],
     )
     def test_it_accepts_valid_email_addresses(self, value):
         assert Email().clean(value) == value
@@ -329,6 +392,8 @@ class TestEmailField:
             "test @example.com",
             "test@ example.com",
             "test@example .com",
+            "test@example.c0m",
+            "tést@exämple..com",
         ],
     )
     def test_it_rejects_invalid_email_addresses(self, value):
@@ -429,6 +494,24 @@ class TestIntegerField:
             Integer(required=False).clean(None)
         assert e.value.args[0] is None
 
+    def test_it_respects_subclass_has_value(self):
+        class NonZeroInteger(Integer):
+            def has_value(self, value):
+                return bool(value)
+
+        with pytest.raises(ValidationError, match="This field is required."):
+            NonZeroInteger().clean(0)
+
+    def test_it_runs_mixin_clean_methods(self):
+        class Clamp(Field):
+            def clean(self, value):
+                return min(super().clean(value), 10)
+
+        class ClampedInteger(Integer, Clamp):
+            pass
+
+        assert ClampedInteger().clean(50) == 10
+
     @pytest.mark.parametrize("value", ["", "0", 23.0])
     def test_it_enforces_valid_data_type(self, value):
         expected_err_msg = "Value must be of int type."
@@ -444,10 +527,7 @@ class TestListField:
     def test_it_validates_each_value(self):
         with pytest.raises(ValidationError) as e:
             List(String(max_length=3)).clean(["a", 2, "c", "long"])
-        assert e.value.args[0]["errors"][1] in (
-            "Value must be of basestring type.",
-            "Value must be of str type.",
-        )
+        assert e.value.args[0]["errors"][1] == "Value must be of str type."
         assert e.value.args[0]["errors"][3] == (
             "The value must be no longer than 3 characters."
         )
@@ -485,6 +565,25 @@ class TestListField:
         field = List(String(default="xyz"))
         assert field.clean(["abc", None]) == ["abc", "xyz"]
 
+    def test_it_accepts_a_list_of_integers(self):
+        values = [1, 2, True, 3]
+        cleaned = List(Integer(min_value=1, max_value=3)).clean(values)
+        assert cleaned == values
+        assert cleaned is not values
+
+    def test_it_validates_each_integer(self):
+        with pytest.raises(ValidationError) as e:
+            List(Integer(min_value=1)).clean([1, 0, "2", 3])
+        assert e.value.args[0]["errors"] == {
+            1: "The value must be at least 1.",
+            2: "Value must be of int type.",
+        }
+
+    def test_it_validates_empty_strings(self):
+        with pytest.raises(ValidationError) as e:
+            List(String()).clean(["a", ""])
+        assert e.value.args[0]["errors"] == {1: "This field is required."}
+
 
 class ClassWithID:
     id = None
@@ -694,6 +793,16 @@ class TestURLField:
         field = URL(default_scheme="https", allowed_schemes=["https", "ftps"])
         assert field.clean(value) == expected
 
+    def test_it_exposes_per_scheme_regexes(self):
+        field = URL(allowed_schemes=["https"], disallowed_schemes=["ftp:"])
+        assert [r.pattern for r in field.allowed_schemes_regexes] == [
+            "^https://.*"
+        ]
+        assert [r.pattern for r in field.disallowed_schemes_regexes] == [
+            "^ftp:.*"
+        ]
+        assert URL().allowed_schemes_regexes == []
+
     @pytest.mark.parametrize("value", ["", None])
     def test_it_enforces_required_flag(self, value):
         expected_err_msg = "This field is required."
@@ -1044,6 +1153,38 @@ class TestSchema:
             "value_id": "Value must be of int type."
         }
 
+    def test_get_fields(self):
+        class BaseSchema(Schema):
+            name = String()
+
+        class TestSchema(BaseSchema):
+            value = Integer(field_name="value_id")
+
+        assert BaseSchema.get_fields() == {"name": BaseSchema.name}
+        assert TestSchema.get_fields() == {
+            "name": BaseSchema.name,
+            "value_id": TestSchema.value,
+        }
+
+        # Changes to one schema's fields don't leak into other instances.
+        schema = TestSchema()
+        del schema.fields["name"]
+        assert TestSchema().fields == TestSchema.get_fields()
+        assert "name" in TestSchema.get_fields()
+
+    def test_reserved_field_names(self):
+        class TestSchema(Schema):
+            errors = String()
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="are reserved"):
+                TestSchema()
+
+        class RenamedSchema(Schema):
+            errors_ = String(field_name="errors")
+
+        assert RenamedSchema({"errors": "x"}).full_clean() == {"errors": "x"}
+
 
 @pytest.mark.parametrize("keep_type_field", [False, True])
 def test_polymorphic_field(keep_type_field):
@@ -2,7 +2,8 @@ import pytest
 from bson import ObjectId
 from mongoengine import Document, EmbeddedDocument, StringField, connect
 
-from cleancat import Schema, StopValidation, String, ValidationError
+from cleancat import List, Schema, StopValidation, String, ValidationError
+from cleancat.base import ReferenceNotFoundError
 from cleancat.mongo import (
     MongoEmbedded,
     MongoEmbeddedReference,
@@ -84,6 +85,64 @@ class TestMongoReferenceField:
         pytest.raises(ValidationError, schema.full_clean)
         assert schema.field_errors == {"author_id": "Object does not exist."}
 
+    def test_it_can_limit_the_fetched_fields(self, person_cls):
+        field = MongoReference(person_cls, fetch_fields=("id",))
+        doc = person_cls.objects.create(name="Steve")
+        clean_doc = field.clean(str(doc.pk))
+        assert clean_doc.pk == doc.pk
+        assert clean_doc.name is None
+
+    def test_it_fetches_a_list_of_docs(self, person_cls, monkeypatch):
+        steve = person_cls.objects.create(name="Steve")
+        bill = person_cls.objects.create(name="Bill")
+
+        calls = []
+        fetch_object = MongoReference.fetch_object
+        fetch_objects = MongoReference.fetch_objects
+        monkeypatch.setattr(
+            MongoReference,
+            "fetch_object",
+            lambda self, doc_id: calls.append("one")
+            or fetch_object(self, doc_id),
+        )
+        monkeypatch.setattr(
+            MongoReference,
+            "fetch_objects",
+            lambda self, doc_ids: calls.append("bulk")
+            or fetch_objects(self, doc_ids),
+        )
+
+        field = List(MongoReference(person_cls))
+        assert field.clean([str(bill.pk), str(steve.pk), str(bill.pk)]) == [
+            bill,
+            steve,
+            bill,
+        ]
+        assert calls == ["bulk"]
+
+    def test_it_uses_a_subclass_fetch_object_for_a_list(self, person_cls):
+        class ActivePersonReference(MongoReference):
+            def fetch_object(self, doc_id):
+                doc = super().fetch_object(doc_id)
+                if doc.name == "Deleted":
+                    raise ReferenceNotFoundError
+                return doc
+
+        doc = person_cls.objects.create(name="Deleted")
+        field = ActivePersonReference(person_cls)
+        with pytest.raises(ValidationError, match="Object does not exist."):
+            field.clean(str(doc.pk))
+        with pytest.raises(ValidationError) as e:
+            List(field).clean([str(doc.pk)])
+        assert e.value.args[0] == {"errors": {0: "Object does not exist."}}
+
+    def test_it_rejects_missing_docs_in_a_list(self, person_cls):
+        doc = person_cls.objects.create(name="Steve")
+        field = List(MongoReference(person_cls))
+        with pytest.raises(ValidationError) as e:
+            field.clean([str(doc.pk), str(ObjectId())])
+        assert e.value.args[0] == {"errors": {1: "Object does not exist."}}
+
 
 class TestSchemaWithMongoEmbeddedReferenceField:
     @pytest.fixture()
@@ -114,6 +173,14 @@ class TestSchemaWithMongoEmbeddedReferenceField:
         assert author.pk == doc.pk
         assert author.name == "Updated"
 
+    def test_orig_data_is_a_snapshot(self, schema_cls, person_cls):
+        doc = person_cls.objects.create(name="Steve")
+        orig_data = schema_cls.author.get_orig_data_from_existing(doc)
+        doc.name = "Updated"
+        assert orig_data["name"] == "Steve"
+        orig_data["name"] = "Changed"
+        assert doc.name == "Updated"
+
     def test_updating_missing_instance_fails(self, schema_cls):
         schema = schema_cls(
             {
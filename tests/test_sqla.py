@@ -3,7 +3,15 @@ import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from cleancat import Integer, Schema, StopValidation, String, ValidationError
+from cleancat import (
+    Integer,
+    List,
+    Schema,
+    StopValidation,
+    String,
+    ValidationError,
+)
+from cleancat.base import ReferenceNotFoundError
 from cleancat.sqla import SQLAEmbeddedReference, SQLAReference, object_as_dict
 
 Base = declarative_base()
@@ -53,6 +61,73 @@ class TestSQLAReferenceField:
             field.clean(None)
         assert e.value.args[0] is None
 
+    def test_it_serializes_to_the_pk(self, sqla_session):
+        steve = Person(name="Steve", age=30)
+        sqla_session.add(steve)
+        sqla_session.commit()
+
+        field = SQLAReference(Person)
+        assert field.serialize(steve) == steve.id
+        assert field.serialize(None) is None
+
+    def test_it_fetches_a_list_of_instances(self, sqla_session):
+        steve = Person(name="Steve", age=30)
+        bill = Person(name="Bill", age=40)
+        sqla_session.add_all([steve, bill])
+        sqla_session.commit()
+
+        ids = [str(bill.id), str(steve.id)]
+
+        statements = []
+        sa.event.listen(
+            sqla_session.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        field = List(SQLAReference(Person))
+        assert field.clean(ids) == [bill, steve]
+        assert len(statements) == 1
+
+    def test_it_uses_a_subclass_fetch_object_for_a_list(self, sqla_session):
+        class AdultReference(SQLAReference):
+            def fetch_object(self, model_id):
+                model = super().fetch_object(model_id)
+                if model.age < 18:
+                    raise ReferenceNotFoundError
+                return model
+
+        kid = Person(name="Kid", age=10)
+        sqla_session.add(kid)
+        sqla_session.commit()
+
+        field = AdultReference(Person)
+        with pytest.raises(ValidationError, match="Object does not exist."):
+            field.clean(str(kid.id))
+        with pytest.raises(ValidationError) as e:
+            List(field).clean([str(kid.id)])
+        assert e.value.args[0] == {"errors": {0: "Object does not exist."}}
+
+    def test_it_rejects_a_non_unique_pk_field_in_a_list(self, sqla_session):
+        sqla_session.add_all(
+            [Person(name="Steve", age=30), Person(name="Steve", age=40)]
+        )
+        sqla_session.commit()
+
+        field = List(SQLAReference(Person, pk_field="name"))
+        with pytest.raises(sa.exc.MultipleResultsFound):
+            field.clean(["Steve"])
+
+    def test_it_rejects_missing_instances_in_a_list(self, sqla_session):
+        steve = Person(name="Steve", age=30)
+        sqla_session.add(steve)
+        sqla_session.commit()
+
+        field = List(SQLAReference(Person))
+        with pytest.raises(ValidationError) as e:
+            field.clean([str(steve.id), "123456789"])
+        assert e.value.args[0] == {"errors": {1: "Object does not exist."}}
+
 
 @pytest.mark.usefixtures("sqla_session")
 class TestSchemaWithSQLAEmbeddedReference: